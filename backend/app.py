@@ -1,20 +1,40 @@
 import argparse
+import asyncio
 import os
 from contextlib import asynccontextmanager
 from pathlib import Path
 
+from anyio import to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
 
-from .database import init_db, get_session
+from .database import MAX_OVERFLOW, POOL_SIZE, init_db, get_session
+from .responses import ORJSONResponse
 from .routes import router
 from .services import load_candidates_from_disk, set_applicants_path
+from .static import CachedStaticFiles
+
+
+def load_candidates() -> None:
+    """Load new candidates from the applicants directory into the database."""
+    reader_workers = os.environ.get("READER_WORKERS")
+    session = next(get_session())
+    try:
+        load_candidates_from_disk(
+            session,
+            reader_workers=int(reader_workers) if reader_workers else None,
+            use_threads=os.environ.get("READER_THREADS") == "1",
+        )
+    finally:
+        session.close()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Initialize database and load candidates on startup."""
+    # Sync routes run on AnyIO worker threads; allow one per pooled DB connection
+    to_thread.current_default_thread_limiter().total_tokens = POOL_SIZE + MAX_OVERFLOW
+
     # Check for applicants path from environment variable
     applicants_path = os.environ.get("APPLICANTS_PATH")
     if applicants_path:
@@ -22,12 +42,8 @@ async def lifespan(app: FastAPI):
 
     init_db()
 
-    # Load candidates from disk
-    session = next(get_session())
-    try:
-        load_candidates_from_disk(session)
-    finally:
-        session.close()
+    # Load candidates from disk without blocking the event loop
+    await asyncio.to_thread(load_candidates)
 
     yield
 
@@ -37,6 +53,7 @@ app = FastAPI(
     description="API for reviewing job candidates",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware for development
@@ -54,7 +71,7 @@ app.include_router(router, prefix="/api")
 # Serve frontend static files if dist exists
 frontend_dist = Path(__file__).parent.parent / "frontend" / "dist"
 if frontend_dist.exists():
-    app.mount("/", StaticFiles(directory=str(frontend_dist), html=True), name="static")
+    app.mount("/", CachedStaticFiles(directory=str(frontend_dist), html=True), name="static")
 
 
 if __name__ == "__main__":
@@ -69,12 +86,26 @@ if __name__ == "__main__":
         type=str,
         help="Path to directory containing applicant folders",
     )
+    parser.add_argument(
+        "--reader-workers",
+        type=int,
+        help="Number of workers used to load applicant folders (default: CPU count)",
+    )
+    parser.add_argument(
+        "--reader-threads",
+        action="store_true",
+        help="Load applicant folders with threads instead of processes",
+    )
 
     args = parser.parse_args()
 
     # Set environment variable for applicants path (used by lifespan)
     if args.applicants:
         os.environ["APPLICANTS_PATH"] = args.applicants
+    if args.reader_workers:
+        os.environ["READER_WORKERS"] = str(args.reader_workers)
+    if args.reader_threads:
+        os.environ["READER_THREADS"] = "1"
 
     uvicorn.run(
         "backend.app:app",
@@ -1,16 +1,115 @@
+from sqlalchemy import column, event, inspect, table
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.schema import CreateColumn
 from sqlmodel import create_engine, Session, SQLModel
 
+from .models import Candidate
+
 DATABASE_URL = "sqlite:///recruiting.db"
 
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+# Each request holds one pooled connection for its lifetime via get_session.
+# The app sizes its request threadpool to POOL_SIZE + MAX_OVERFLOW so every
+# thread can get a connection; never open a second session inside a request,
+# or requests can deadlock waiting on connections held by other requests.
+POOL_SIZE = 20
+MAX_OVERFLOW = 80
+
+engine = create_engine(
+    DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    poolclass=QueuePool,
+    pool_size=POOL_SIZE,
+    max_overflow=MAX_OVERFLOW,
+    pool_pre_ping=True,
+)
+
+
+@event.listens_for(engine, "connect")
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Use WAL with relaxed syncing and a larger page cache on every connection."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA cache_size=-65536")  # 64 MiB
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256 MiB
+    cursor.close()
+
+
+# Session factory configured once for all requests. Attributes stay loaded
+# after commit so handlers can return them without a re-SELECT.
+SessionLocal = sessionmaker(bind=engine, class_=Session, expire_on_commit=False)
+
+
+# Columns covered by the full-text search index
+FTS_COLUMNS = ("full_name", "title", "experience_text", "education_text", "cv_text")
+
+# Lightweight handle for querying the FTS5 index (not part of SQLModel.metadata)
+candidate_fts = table("candidate_fts", column("rowid"), column("rank"), column("candidate_fts"))
+
+
+@event.listens_for(SQLModel.metadata, "after_create")
+def create_search_index(target, connection, **kw):
+    """Create the FTS5 search index over candidates and the triggers that keep it in sync."""
+    exists = connection.exec_driver_sql(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'candidate_fts'"
+    ).first()
+    if exists:
+        return
+
+    cols = ", ".join(FTS_COLUMNS)
+    new_cols = ", ".join(f"new.{c}" for c in FTS_COLUMNS)
+    old_cols = ", ".join(f"old.{c}" for c in FTS_COLUMNS)
+
+    connection.exec_driver_sql(
+        f"CREATE VIRTUAL TABLE candidate_fts USING fts5({cols}, "
+        "content='candidate', content_rowid='id', tokenize='unicode61')"
+    )
+    connection.exec_driver_sql(
+        f"""CREATE TRIGGER candidate_fts_ai AFTER INSERT ON candidate BEGIN
+            INSERT INTO candidate_fts(rowid, {cols}) VALUES (new.id, {new_cols});
+        END"""
+    )
+    connection.exec_driver_sql(
+        f"""CREATE TRIGGER candidate_fts_ad AFTER DELETE ON candidate BEGIN
+            INSERT INTO candidate_fts(candidate_fts, rowid, {cols}) VALUES ('delete', old.id, {old_cols});
+        END"""
+    )
+    # Only re-index when searchable text changes, not on star/view/notes updates
+    connection.exec_driver_sql(
+        f"""CREATE TRIGGER candidate_fts_au AFTER UPDATE OF {cols} ON candidate BEGIN
+            INSERT INTO candidate_fts(candidate_fts, rowid, {cols}) VALUES ('delete', old.id, {old_cols});
+            INSERT INTO candidate_fts(rowid, {cols}) VALUES (new.id, {new_cols});
+        END"""
+    )
+    # Index any rows that existed before the search index was created
+    connection.exec_driver_sql("INSERT INTO candidate_fts(candidate_fts) VALUES ('rebuild')")
+
+
+def optimize_search_index(connection) -> None:
+    """Merge the FTS5 index into a single b-tree after bulk inserts."""
+    connection.exec_driver_sql("INSERT INTO candidate_fts(candidate_fts) VALUES ('optimize')")
 
 
 def init_db():
     """Create all database tables."""
     SQLModel.metadata.create_all(engine)
 
+    # create_all never alters existing tables; add columns introduced since
+    existing = {c["name"] for c in inspect(engine).get_columns("candidate")}
+    with engine.begin() as connection:
+        for col in Candidate.__table__.columns:
+            if col.name not in existing:
+                ddl = CreateColumn(col).compile(dialect=engine.dialect)
+                connection.exec_driver_sql(f"ALTER TABLE candidate ADD COLUMN {ddl}")
+
+    # create_all only builds indexes with new tables; add any missing ones
+    for index in Candidate.__table__.indexes:
+        index.create(engine, checkfirst=True)
+
 
 def get_session():
-    """Dependency to get database session."""
-    with Session(engine) as session:
+    """Dependency to get database session (one pooled connection per request)."""
+    with SessionLocal() as session:
         yield session
@@ -1,11 +1,15 @@
+from sqlalchemy import JSON, Column, Index, literal_column
 from sqlmodel import SQLModel, Field
-from typing import Optional
+from typing import Optional, TypedDict
 from datetime import datetime, timezone
 from pydantic import BaseModel
 
 
+_UTC = timezone.utc
+
+
 def utc_now():
-    return datetime.now(timezone.utc)
+    return datetime.now(_UTC)
 
 
 class Candidate(SQLModel, table=True):
@@ -16,9 +20,9 @@ class Candidate(SQLModel, table=True):
     title: Optional[str] = None
     primary_email: Optional[str] = None
     linkedin_url: Optional[str] = None
-    display_urls: Optional[str] = None  # JSON array string
-    experience: Optional[str] = None  # JSON array string
-    education: Optional[str] = None  # JSON array string
+    display_urls: Optional[list[str]] = Field(default=None, sa_column=Column(JSON))
+    experience: Optional[list[dict]] = Field(default=None, sa_column=Column(JSON))
+    education: Optional[list[dict]] = Field(default=None, sa_column=Column(JSON))
 
     # Flattened text for search
     experience_text: Optional[str] = None
@@ -31,8 +35,37 @@ class Candidate(SQLModel, table=True):
     viewed: bool = Field(default=False)
     viewed_at: Optional[datetime] = None
 
+    # Bumped by every PATCH for optimistic concurrency
+    version: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+
     created_at: datetime = Field(default_factory=utc_now)
-    updated_at: datetime = Field(default_factory=utc_now)
+    updated_at: datetime = Field(default_factory=utc_now, index=True)
+
+
+# Candidates with non-empty notes (NULL notes never match)
+NOTES_NONEMPTY = Candidate.notes != literal_column("''")
+
+# Partial indexes holding only the flagged rows, so stats counts read just the
+# matches. SQLite uses them when a query repeats the same WHERE expression.
+VIEWED_INDEX = Index(
+    "ix_candidate_viewed_true", Candidate.id, sqlite_where=Candidate.viewed == True  # noqa: E712
+)
+STARRED_INDEX = Index(
+    "ix_candidate_starred_true", Candidate.id, sqlite_where=Candidate.starred == True  # noqa: E712
+)
+HAS_NOTES_INDEX = Index("ix_candidate_has_notes", Candidate.id, sqlite_where=NOTES_NONEMPTY)
+
+# Covering index in list order, so the summary list is an index-only scan that
+# never reads the wide rows holding JSON and CV text
+Index(
+    "ix_candidate_list_cover",
+    Candidate.full_name,
+    Candidate.folder_name,
+    Candidate.title,
+    Candidate.starred,
+    Candidate.viewed,
+    Candidate.notes,
+)
 
 
 class CandidateUpdate(BaseModel):
@@ -40,6 +73,31 @@ class CandidateUpdate(BaseModel):
     starred: Optional[bool] = None
     notes: Optional[str] = None
     viewed: Optional[bool] = None
+    # When given, the update only applies if the candidate is still at this version
+    version: Optional[int] = None
+
+
+class CandidateSummaryDict(TypedDict):
+    """Row shape of the candidate list, serialized without model validation."""
+    id: int
+    folder_name: str
+    full_name: str
+    title: Optional[str]
+    starred: bool
+    viewed: bool
+    has_notes: bool
+
+
+class SearchResultDict(TypedDict):
+    """Row shape of search results, serialized without model validation."""
+    id: int
+    folder_name: str
+    full_name: str
+    title: Optional[str]
+    starred: bool
+    viewed: bool
+    education_text: Optional[str]
+    experience_text: Optional[str]
 
 
 class ApiResponse(BaseModel):
@@ -0,0 +1,19 @@
+from typing import Any, Iterable
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response serialized with orjson (handles datetimes natively)."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def render_ndjson(items: Iterable[Any]) -> bytes:
+    """Serialize items as newline-delimited JSON, one orjson line per item."""
+    return b"".join(orjson.dumps(item, option=orjson.OPT_NON_STR_KEYS) + b"\n" for item in items)
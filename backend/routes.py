@@ -1,185 +1,407 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import FileResponse
-from sqlmodel import Session, select, or_
-
-from .database import get_session
-from .models import Candidate, CandidateUpdate, ApiResponse, utc_now
+import time
+from datetime import datetime
+from typing import Any, Callable, Iterator, Optional, TypeVar
+
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import FileResponse, StreamingResponse
+from sqlalchemy import Engine, Index, event, false, text
+from sqlalchemy.dialects import sqlite
+from sqlmodel import Session, func, select, update
+
+from .database import candidate_fts, get_session
+from .models import (
+    Candidate,
+    CandidateSummaryDict,
+    CandidateUpdate,
+    ApiResponse,
+    HAS_NOTES_INDEX,
+    NOTES_NONEMPTY,
+    SearchResultDict,
+    STARRED_INDEX,
+    VIEWED_INDEX,
+    utc_now,
+)
+from .responses import NDJSON_MEDIA_TYPE, ORJSONResponse, render_ndjson
 from .services import get_applicants_path
 
 router = APIRouter()
 
+T = TypeVar("T")
+
+# Columns projected for list/search results, so large text fields are never loaded
+SUMMARY_COLUMNS = (
+    Candidate.id,
+    Candidate.folder_name,
+    Candidate.full_name,
+    Candidate.title,
+    Candidate.starred,
+    Candidate.viewed,
+)
+
+HAS_NOTES = func.coalesce(NOTES_NONEMPTY, false()).label("has_notes")
+
+# Read-only payloads cached per database and key, dropped on any commit
+CACHE_TTL_SECONDS = 60.0
+_response_cache: dict[tuple[Engine, str], tuple[float, Any]] = {}
+_cache_generation = 0
+
+
+@event.listens_for(Session, "after_commit")
+def _clear_response_cache(session: Session) -> None:
+    global _cache_generation
+    _cache_generation += 1
+    _response_cache.clear()
+
+
+def cached(session: Session, key: str, compute: Callable[[], T]) -> T:
+    """Return a cached value for this session's database, computing it on a miss."""
+    cache_key = (session.get_bind(), key)
+    entry = _response_cache.get(cache_key)
+    if entry:
+        if time.monotonic() - entry[0] < CACHE_TTL_SECONDS:
+            return entry[1]
+        _response_cache.pop(cache_key, None)
+
+    generation = _cache_generation
+    value = compute()
+    # Skip storing if a commit landed mid-compute; the value may predate it
+    if generation == _cache_generation:
+        _response_cache[cache_key] = (time.monotonic(), value)
+    return value
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the request's If-None-Match header matches an ETag."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags
+
+
+def summary_query(limit: Optional[int], offset: int):
+    """Select one page of candidate summaries in list order."""
+    return (
+        select(*SUMMARY_COLUMNS, HAS_NOTES)
+        .order_by(Candidate.full_name, Candidate.folder_name)
+        .limit(limit)
+        .offset(offset)
+    )
 
-@router.get("/candidates")
-def get_candidates(session: Session = Depends(get_session)) -> ApiResponse:
-    """Get all candidates (summary view)."""
-    candidates = session.exec(select(Candidate).order_by(Candidate.full_name)).all()
-
-    # Return summary data for list view
-    summary = [
-        {
-            "id": c.id,
-            "folder_name": c.folder_name,
-            "full_name": c.full_name,
-            "title": c.title,
-            "starred": c.starred,
-            "viewed": c.viewed,
-            "has_notes": bool(c.notes),
-        }
-        for c in candidates
-    ]
 
-    return ApiResponse(
-        status=True,
-        message=f"Retrieved {len(summary)} candidates",
-        data={"candidates": summary},
+def summary_dict(row) -> CandidateSummaryDict:
+    """Build a list entry from a row of summary_query."""
+    return CandidateSummaryDict(
+        id=row.id,
+        folder_name=row.folder_name,
+        full_name=row.full_name,
+        title=row.title,
+        starred=row.starred,
+        viewed=row.viewed,
+        has_notes=row.has_notes,
     )
 
 
-@router.get("/candidates/{candidate_id}")
-def get_candidate(candidate_id: int, session: Session = Depends(get_session)) -> ApiResponse:
+@router.get("/candidates", response_model=ApiResponse)
+def get_candidates(
+    request: Request,
+    limit: Optional[int] = Query(None, ge=1),
+    offset: int = Query(0, ge=0),
+    session: Session = Depends(get_session),
+) -> Response:
+    """Get candidates (summary view), optionally one page at a time.
+
+    Clients that accept application/x-ndjson get one summary per line,
+    streamed in batches instead of built in memory.
+    """
+    if NDJSON_MEDIA_TYPE in request.headers.get("accept", ""):
+        # The request session has not touched its connection yet, so the
+        # stream can check out its own without holding two at once
+        return StreamingResponse(
+            _stream_candidates(session.get_bind(), limit, offset),
+            media_type=NDJSON_MEDIA_TYPE,
+            headers={"Vary": "Accept"},
+        )
+
+    # Only the full list is cached, so client-chosen page bounds can't grow
+    # the cache; pages are rendered per request, after the ETag check
+    if limit is None and offset == 0:
+        etag, body = cached(session, "candidates", lambda: _render_candidates(session))
+    else:
+        etag, count = _list_version(session)
+        body = None
+    # The format depends on Accept, so caches must key on it too
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache", "Vary": "Accept"}
+
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+
+    if body is None:
+        body = _render_page(session, count, limit, offset)
+    return Response(body, media_type="application/json", headers=headers)
+
+
+def _list_version(session: Session) -> tuple[str, int]:
+    """Return the candidate list's ETag and total row count."""
+    # Writes bump updated_at and inserts/deletes change the count, so the
+    # pair identifies the list's version
+    last_updated, count = session.exec(
+        select(func.max(Candidate.updated_at), func.count())
+    ).one()
+    version = int(last_updated.timestamp() * 1e6) if last_updated else 0
+    return f'W/"{version:x}-{count:x}"', count
+
+
+def _render_page(
+    session: Session, count: int, limit: Optional[int] = None, offset: int = 0
+) -> bytes:
+    """Serialize one page of the candidate list."""
+    rows = session.exec(summary_query(limit, offset)).all()
+
+    # Return summary data for list view
+    summary = [summary_dict(row) for row in rows]
+
+    # Plain dicts go straight to orjson, skipping response model validation
+    return ORJSONResponse({
+        "status": True,
+        "message": f"Retrieved {len(summary)} candidates",
+        "data": {"candidates": summary, "total": count},
+    }).body
+
+
+def _render_candidates(session: Session) -> tuple[str, bytes]:
+    """Build the full candidate list's ETag and serialized body."""
+    etag, count = _list_version(session)
+    return etag, _render_page(session, count)
+
+
+def _stream_candidates(bind: Engine, limit: Optional[int], offset: int) -> Iterator[bytes]:
+    """Yield candidate summaries as NDJSON, fetching rows in batches."""
+    with Session(bind) as session:
+        result = session.exec(summary_query(limit, offset).execution_options(yield_per=500))
+        for rows in result.partitions():
+            yield render_ndjson(summary_dict(row) for row in rows)
+
+
+def _mark_viewed(bind: Engine, candidate_id: int, now: datetime) -> None:
+    """Persist a first view; a no-op if the candidate is already marked viewed."""
+    with Session(bind) as session:
+        session.exec(
+            update(Candidate)
+            .where(Candidate.id == candidate_id, Candidate.viewed == False)  # noqa: E712
+            .values(viewed=True, viewed_at=now, updated_at=now)
+        )
+        session.commit()
+
+
+@router.get("/candidates/{candidate_id}", response_model=ApiResponse)
+def get_candidate(
+    candidate_id: int,
+    background_tasks: BackgroundTasks,
+    session: Session = Depends(get_session),
+) -> ORJSONResponse:
     """Get full candidate data and mark as viewed."""
     candidate = session.get(Candidate, candidate_id)
     if not candidate:
         raise HTTPException(status_code=404, detail="Candidate not found")
 
-    # Mark as viewed if not already
+    data = candidate.model_dump()
+
+    # Mark as viewed if not already, writing after the response is sent
     if not candidate.viewed:
-        candidate.viewed = True
-        candidate.viewed_at = utc_now()
-        candidate.updated_at = utc_now()
-        session.add(candidate)
-        session.commit()
-        session.refresh(candidate)
+        now = utc_now()
+        data.update(viewed=True, viewed_at=now, updated_at=now)
+        # Return the request's connection first; the task checks out its own
+        bind = session.get_bind()
+        session.close()
+        background_tasks.add_task(_mark_viewed, bind, candidate_id, now)
 
-    return ApiResponse(
-        status=True,
-        message="Candidate retrieved",
-        data=candidate.model_dump(),
-    )
+    return ORJSONResponse({
+        "status": True,
+        "message": "Candidate retrieved",
+        "data": data,
+    })
 
 
 @router.get("/candidates/{candidate_id}/resume")
-def get_resume(candidate_id: int, session: Session = Depends(get_session)):
+def get_resume(candidate_id: int, request: Request, session: Session = Depends(get_session)):
     """Serve the candidate's resume PDF."""
-    candidate = session.get(Candidate, candidate_id)
-    if not candidate:
+    folder_name = session.exec(
+        select(Candidate.folder_name).where(Candidate.id == candidate_id)
+    ).first()
+    if not folder_name:
         raise HTTPException(status_code=404, detail="Candidate not found")
 
-    pdf_path = get_applicants_path() / candidate.folder_name / "cv.pdf"
-    if not pdf_path.exists():
+    pdf_path = get_applicants_path() / folder_name / "cv.pdf"
+    try:
+        stat_result = pdf_path.stat()
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Resume not found")
 
+    etag = f'W/"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+    headers = {"ETag": etag, "Cache-Control": "private, max-age=3600"}
+
+    # Let the browser reuse its cached copy without opening the file
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+
     return FileResponse(
         path=str(pdf_path),
         media_type="application/pdf",
-        headers={"Content-Disposition": "inline"},
+        headers={"Content-Disposition": "inline", **headers},
+        stat_result=stat_result,
     )
 
 
-@router.patch("/candidates/{candidate_id}")
+@router.patch("/candidates/{candidate_id}", response_model=ApiResponse)
 def update_candidate(
     candidate_id: int,
-    update: CandidateUpdate,
+    changes: CandidateUpdate,
     session: Session = Depends(get_session),
-) -> ApiResponse:
-    """Update candidate review fields (starred, notes, viewed)."""
-    candidate = session.get(Candidate, candidate_id)
-    if not candidate:
+) -> ORJSONResponse:
+    """Update candidate review fields (starred, notes, viewed).
+
+    If a version is given and the candidate has changed since, nothing is
+    written and a 409 is returned.
+    """
+    now = utc_now()
+    values = {"updated_at": now, "version": Candidate.version + 1}
+    if changes.starred is not None:
+        values["starred"] = changes.starred
+    if changes.notes is not None:
+        values["notes"] = changes.notes
+    if changes.viewed is not None:
+        values["viewed"] = changes.viewed
+        if changes.viewed:
+            values["viewed_at"] = func.coalesce(Candidate.viewed_at, now)
+
+    criteria = [Candidate.id == candidate_id]
+    if changes.version is not None:
+        criteria.append(Candidate.version == changes.version)
+
+    # Write and read back the updated row in one statement
+    row = session.exec(
+        update(Candidate)
+        .where(*criteria)
+        .values(**values)
+        .returning(*Candidate.__table__.columns)
+    ).first()
+    if row is None:
+        # No row matched: either it is gone or its version moved on
+        exists = changes.version is not None and session.exec(
+            select(Candidate.id).where(Candidate.id == candidate_id)
+        ).first()
+        if exists:
+            raise HTTPException(status_code=409, detail="Candidate was modified by another request")
         raise HTTPException(status_code=404, detail="Candidate not found")
-
-    if update.starred is not None:
-        candidate.starred = update.starred
-    if update.notes is not None:
-        candidate.notes = update.notes
-    if update.viewed is not None:
-        candidate.viewed = update.viewed
-        if update.viewed and not candidate.viewed_at:
-            candidate.viewed_at = utc_now()
-
-    candidate.updated_at = utc_now()
-    session.add(candidate)
     session.commit()
-    session.refresh(candidate)
 
-    return ApiResponse(
-        status=True,
-        message="Candidate updated",
-        data=candidate.model_dump(),
-    )
+    return ORJSONResponse({
+        "status": True,
+        "message": "Candidate updated",
+        "data": dict(row._mapping),
+    })
 
 
-@router.get("/search")
+@router.get("/search", response_model=ApiResponse)
 def search_candidates(
     q: str = Query(..., min_length=1),
+    limit: Optional[int] = Query(None, ge=1),
+    offset: int = Query(0, ge=0),
     session: Session = Depends(get_session),
-) -> ApiResponse:
+) -> ORJSONResponse:
     """Search candidates by name, experience, education, or CV text (whole word match)."""
-    import re
-
-    query_pattern = f"%{q}%"
-
-    # First, get candidates that contain the substring (fast DB query)
-    candidates = session.exec(
-        select(Candidate).where(
-            or_(
-                Candidate.full_name.ilike(query_pattern),
-                Candidate.experience_text.ilike(query_pattern),
-                Candidate.education_text.ilike(query_pattern),
-                Candidate.title.ilike(query_pattern),
-                Candidate.cv_text.ilike(query_pattern),
-            )
-        ).order_by(Candidate.full_name)
+    # A quoted FTS5 phrase matches on token boundaries, giving whole-word semantics
+    phrase = '"' + q.replace('"', '""') + '"'
+    matches = candidate_fts.c.candidate_fts.op("MATCH")(phrase)
+
+    rows = session.exec(
+        select(*SUMMARY_COLUMNS, Candidate.education_text, Candidate.experience_text)
+        .join(candidate_fts, candidate_fts.c.rowid == Candidate.id)
+        .where(matches)
+        .order_by(candidate_fts.c.rank, Candidate.id)
+        .limit(limit)
+        .offset(offset)
     ).all()
 
-    # Then filter for whole word matches using regex
-    word_pattern = re.compile(r'\b' + re.escape(q) + r'\b', re.IGNORECASE)
-
-    def matches_whole_word(c: Candidate) -> bool:
-        fields = [c.full_name, c.experience_text, c.education_text, c.title, c.cv_text]
-        return any(field and word_pattern.search(field) for field in fields)
-
-    candidates = [c for c in candidates if matches_whole_word(c)]
-
     # Return summary for search results
     results = [
-        {
-            "id": c.id,
-            "folder_name": c.folder_name,
-            "full_name": c.full_name,
-            "title": c.title,
-            "education_text": c.education_text,
-            "experience_text": c.experience_text,
-            "starred": c.starred,
-            "viewed": c.viewed,
-        }
-        for c in candidates
+        SearchResultDict(
+            id=row.id,
+            folder_name=row.folder_name,
+            full_name=row.full_name,
+            title=row.title,
+            starred=row.starred,
+            viewed=row.viewed,
+            education_text=row.education_text,
+            experience_text=row.experience_text,
+        )
+        for row in rows
     ]
 
-    return ApiResponse(
-        status=True,
-        message=f"Found {len(results)} results for '{q}'",
-        data={"candidates": results, "query": q},
+    # Count all matches only when a page was requested
+    total = len(results)
+    if limit is not None or offset:
+        total = session.exec(
+            select(func.count()).select_from(candidate_fts).where(matches)
+        ).one()
+
+    return ORJSONResponse({
+        "status": True,
+        "message": f"Found {total} results for '{q}'",
+        "data": {"candidates": results, "query": q, "total": total},
+    })
+
+
+def count_candidates(*criteria):
+    """Scalar subquery counting candidates matching the given criteria."""
+    return select(func.count()).select_from(Candidate).where(*criteria).scalar_subquery()
+
+
+def count_partial_index(index: Index):
+    """Scalar subquery counting the rows of a partial index, read through it.
+
+    SQLite would otherwise scan the list covering index, which also holds the
+    flag columns. INDEXED BY pins the plan, and repeating the index's own WHERE
+    keeps the query eligible for it.
+    """
+    where = index.dialect_options["sqlite"]["where"].compile(
+        dialect=sqlite.dialect(), compile_kwargs={"literal_binds": True}
     )
+    return (
+        select(func.count())
+        .select_from(text(f"{Candidate.__tablename__} INDEXED BY {index.name}"))
+        .where(text(str(where)))
+        .scalar_subquery()
+    )
+
 
+# One round trip; each flagged count is answered from its partial index
+STATS_QUERY = select(
+    count_candidates(),
+    count_partial_index(VIEWED_INDEX),
+    count_partial_index(STARRED_INDEX),
+    count_partial_index(HAS_NOTES_INDEX),
+)
 
-@router.get("/stats")
-def get_stats(session: Session = Depends(get_session)) -> ApiResponse:
+
+@router.get("/stats", response_model=ApiResponse)
+def get_stats(session: Session = Depends(get_session)) -> ORJSONResponse:
     """Get aggregate statistics."""
-    all_candidates = session.exec(select(Candidate)).all()
-
-    total = len(all_candidates)
-    viewed = sum(1 for c in all_candidates if c.viewed)
-    starred = sum(1 for c in all_candidates if c.starred)
-    with_notes = sum(1 for c in all_candidates if c.notes)
-
-    return ApiResponse(
-        status=True,
-        message="Stats retrieved",
-        data={
-            "total": total,
-            "viewed": viewed,
-            "unviewed": total - viewed,
-            "starred": starred,
-            "with_notes": with_notes,
-        },
-    )
+    return ORJSONResponse({
+        "status": True,
+        "message": "Stats retrieved",
+        "data": cached(session, "stats", lambda: _compute_stats(session)),
+    })
+
+
+def _compute_stats(session: Session) -> dict:
+    """Count candidates overall and per flag."""
+    total, viewed, starred, with_notes = session.exec(STATS_QUERY).one()
+    return {
+        "total": total,
+        "viewed": viewed,
+        "unviewed": total - viewed,
+        "starred": starred,
+        "with_notes": with_notes,
+    }
@@ -1,4 +1,8 @@
 import json
+import multiprocessing
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 from sqlmodel import Session, select
@@ -9,8 +13,17 @@ try:
 except ImportError:
     HAS_PYMUPDF = False
 
+from .database import optimize_search_index
 from .models import Candidate
 
+if HAS_PYMUPDF:
+    # One-time MuPDF setup per process (including loader workers); extraction
+    # failures are still raised and reported by extract_pdf_text
+    fitz.TOOLS.mupdf_display_errors(False)
+
+# Whitespace run containing a line break (trailing/leading spaces and blank lines)
+_LINE_BREAK_WS = re.compile(r"\s*\n\s*")
+
 # Default applicants path - can be overridden via set_applicants_path()
 _applicants_path: Path = Path(r"C:\Users\corbyrosset\OneDrive - Microsoft\Desktop\tahub\tahub\reqs\Research-Software-Engineer-Multiple-Levels-AI-Frontiers\applicants")
 
@@ -73,21 +86,18 @@ def extract_pdf_text(pdf_path: Path) -> Optional[str]:
         return None
 
     try:
-        doc = fitz.open(str(pdf_path))
-        text_parts = []
+        # Default text flags, but expand ligatures so "ﬁ" is searchable as "fi"
+        flags = fitz.TEXTFLAGS_TEXT & ~fitz.TEXT_PRESERVE_LIGATURES
 
-        for page in doc:
-            text = page.get_text()
-            if text:
-                text_parts.append(text)
+        with fitz.open(str(pdf_path)) as doc:
+            text_parts = [
+                doc.load_page(i).get_text("text", flags=flags) for i in range(doc.page_count)
+            ]
 
-        doc.close()
-
-        # Join all pages and clean up whitespace
-        full_text = "\n\n".join(text_parts)
-        # Normalize whitespace but preserve paragraph structure
-        lines = [line.strip() for line in full_text.split("\n")]
-        cleaned = "\n".join(line for line in lines if line)
+        # Join non-empty pages, then strip whitespace around line breaks and
+        # drop blank lines in one pass
+        full_text = "\n\n".join(filter(None, text_parts))
+        cleaned = _LINE_BREAK_WS.sub("\n", full_text).strip()
 
         return cleaned if cleaned else None
     except Exception as e:
@@ -95,8 +105,8 @@ def extract_pdf_text(pdf_path: Path) -> Optional[str]:
         return None
 
 
-def load_candidate_from_folder(folder: Path) -> Optional[Candidate]:
-    """Load candidate data from a folder containing JSON files."""
+def read_candidate_folder(folder: Path) -> dict:
+    """Read a candidate folder into a dict of Candidate column values (no DB access)."""
     basic_info_path = folder / "basic_info.json"
     personal_info_path = folder / "personal_info.json"
     cv_path = folder / "cv.pdf"
@@ -128,22 +138,60 @@ def load_candidate_from_folder(folder: Path) -> Optional[Candidate]:
     # Extract CV text for search
     cv_text = extract_pdf_text(cv_path)
 
-    return Candidate(
-        folder_name=folder.name,
-        full_name=full_name,
-        title=title,
-        primary_email=primary_email,
-        linkedin_url=linkedin_url,
-        display_urls=json.dumps(filtered_urls),
-        experience=json.dumps(experience),
-        education=json.dumps(education),
-        experience_text=experience_text,
-        education_text=education_text,
-        cv_text=cv_text,
-    )
-
-
-def load_candidates_from_disk(session: Session, applicants_path: Optional[Path] = None):
+    return {
+        "folder_name": folder.name,
+        "full_name": full_name,
+        "title": title,
+        "primary_email": primary_email,
+        "linkedin_url": linkedin_url,
+        "display_urls": filtered_urls,
+        "experience": experience,
+        "education": education,
+        "experience_text": experience_text,
+        "education_text": education_text,
+        "cv_text": cv_text,
+    }
+
+
+def load_candidate_from_folder(folder: Path) -> Candidate:
+    """Load candidate data from a folder containing JSON files."""
+    return Candidate(**read_candidate_folder(folder))
+
+
+def load_candidate_folders(
+    folders: list[Path],
+    reader_workers: Optional[int] = None,
+    use_threads: bool = False,
+) -> list[dict]:
+    """Read candidate folders concurrently, preserving input order.
+
+    CV text extraction is CPU-bound, so a process pool is used by default;
+    set use_threads for platforms where worker processes are unavailable.
+    Workers return plain dicts, which are cheap to send between processes.
+    """
+    if len(folders) <= 1 or reader_workers == 1:
+        return [read_candidate_folder(folder) for folder in folders]
+
+    workers = reader_workers or os.cpu_count() or 1
+    if use_threads:
+        executor = ThreadPoolExecutor(max_workers=workers)
+    else:
+        # The loader runs on a worker thread of a threaded server; forking such
+        # a process can deadlock, so always spawn fresh interpreters
+        executor = ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        )
+    with executor:
+        chunksize = max(1, len(folders) // (workers * 4))
+        return list(executor.map(read_candidate_folder, folders, chunksize=chunksize))
+
+
+def load_candidates_from_disk(
+    session: Session,
+    applicants_path: Optional[Path] = None,
+    reader_workers: Optional[int] = None,
+    use_threads: bool = False,
+):
     """Scan applicant folders and load into database."""
     path = applicants_path or get_applicants_path()
 
@@ -151,26 +199,31 @@ def load_candidates_from_disk(session: Session, applicants_path: Optional[Path]
         print(f"Warning: Applicants path does not exist: {path}")
         return
 
-    loaded_count = 0
+    # Fetch all loaded folder names in one query
+    existing = set(session.exec(select(Candidate.folder_name)).all())
+
     skipped_count = 0
+    new_folders = []
 
     for folder in sorted(path.iterdir()):
         if not folder.is_dir():
             continue
 
         # Skip if already loaded
-        existing = session.exec(
-            select(Candidate).where(Candidate.folder_name == folder.name)
-        ).first()
-
-        if existing:
+        if folder.name in existing:
             skipped_count += 1
             continue
 
-        candidate = load_candidate_from_folder(folder)
-        if candidate:
-            session.add(candidate)
-            loaded_count += 1
+        new_folders.append(folder)
+
+    # Insert as plain mappings to skip per-object unit-of-work bookkeeping;
+    # column defaults fill in review fields and timestamps
+    new_rows = load_candidate_folders(new_folders, reader_workers, use_threads)
+    loaded_count = len(new_rows)
 
+    if new_rows:
+        session.bulk_insert_mappings(Candidate, new_rows)
+        # Keep search lookups to one posting-list read per term
+        optimize_search_index(session.connection())
     session.commit()
     print(f"Loaded {loaded_count} new candidates, skipped {skipped_count} existing")
@@ -0,0 +1,78 @@
+import os
+from email.utils import formatdate
+from mimetypes import guess_type
+from typing import NamedTuple
+
+from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
+from starlette.responses import Response
+from starlette.staticfiles import NotModifiedResponse
+from starlette.types import Scope
+
+# Vite emits content-hashed bundles under assets/, so they never change in place
+HASHED_ASSETS_DIR = "assets"
+
+
+class CachedFile(NamedTuple):
+    """A static file held in memory, keyed to the mtime it was read at."""
+    content: bytes
+    media_type: str
+    mtime_ns: int
+    size: int
+    headers: dict[str, str]
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that serves file contents from memory, re-reading on mtime change."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cache: dict[str, CachedFile] = {}
+
+    def file_response(
+        self,
+        full_path: "os.PathLike[str] | str",
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        path = str(full_path)
+        cached = self._cache.get(path)
+        if (
+            cached is None
+            or cached.mtime_ns != stat_result.st_mtime_ns
+            or cached.size != stat_result.st_size
+        ):
+            cached = self._load(path, stat_result)
+            self._cache[path] = cached
+
+        if self.is_not_modified(Headers(headers=cached.headers), Headers(scope=scope)):
+            return NotModifiedResponse(Headers(headers=cached.headers))
+
+        return Response(
+            cached.content,
+            status_code=status_code,
+            headers=cached.headers,
+            media_type=cached.media_type,
+        )
+
+    def _load(self, path: str, stat_result: os.stat_result) -> CachedFile:
+        """Read a file and build the headers it is served with."""
+        with open(path, "rb") as f:
+            content = f.read()
+
+        relative = os.path.relpath(path, self.directory) if self.directory else path
+        if relative.split(os.sep, 1)[0] == HASHED_ASSETS_DIR:
+            cache_control = "public, max-age=31536000, immutable"
+        else:
+            cache_control = "no-cache"
+
+        headers = {
+            "etag": f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"',
+            "last-modified": formatdate(stat_result.st_mtime, usegmt=True),
+            "cache-control": cache_control,
+        }
+        media_type = guess_type(path)[0] or "application/octet-stream"
+        return CachedFile(
+            content, media_type, stat_result.st_mtime_ns, stat_result.st_size, headers
+        )
@@ -129,16 +129,13 @@ function App() {
       setCurrentCandidate(res.data);
       setEditingNotes(res.data.notes || '');
       // Update local state to reflect viewed status (only if changed)
-      setCandidates(prev => {
-        const candidate = prev.find(c => c.id === id);
-        if (candidate && !candidate.viewed) {
-          // Mark that we're updating viewed status - prevents auto-advance in unviewed filter
-          isViewingRef.current = true;
-          loadStats(); // Only reload stats if viewed status changed
-          return prev.map(c => (c.id === id ? { ...c, viewed: true } : c));
-        }
-        return prev;
-      });
+      if (candidates.find(c => c.id === id && !c.viewed)) {
+        // Mark that we're updating viewed status - prevents auto-advance in unviewed filter
+        isViewingRef.current = true;
+        // The view is recorded server-side after the response, so update counts locally
+        setStats(s => (s ? { ...s, viewed: s.viewed + 1, unviewed: s.unviewed - 1 } : s));
+        setCandidates(prev => prev.map(c => (c.id === id ? { ...c, viewed: true } : c)));
+      }
     }
   };
 
@@ -17,15 +17,16 @@ export interface Candidate {
   title: string | null;
   primary_email: string | null;
   linkedin_url: string | null;
-  display_urls: string | null; // JSON string array
-  experience: string | null; // JSON string array
-  education: string | null; // JSON string array
+  display_urls: string[] | null;
+  experience: Experience[] | null;
+  education: Education[] | null;
   experience_text: string | null;
   education_text: string | null;
   starred: boolean;
   notes: string | null;
   viewed: boolean;
   viewed_at: string | null;
+  version: number;
   created_at: string;
   updated_at: string;
 }
@@ -74,13 +75,14 @@ export interface CandidateUpdate {
   starred?: boolean;
   notes?: string;
   viewed?: boolean;
+  version?: number;
 }
 
 // API Client
 export class RecruitingAPI {
   private static baseUrl = '/api';
 
-  static async getCandidates(): Promise<ApiResponse<{ candidates: CandidateSummary[] }>> {
+  static async getCandidates(): Promise<ApiResponse<{ candidates: CandidateSummary[]; total: number }>> {
     const res = await fetch(`${this.baseUrl}/candidates`);
     return res.json();
   }
@@ -102,7 +104,7 @@ export class RecruitingAPI {
     return res.json();
   }
 
-  static async search(query: string): Promise<ApiResponse<{ candidates: SearchResult[]; query: string }>> {
+  static async search(query: string): Promise<ApiResponse<{ candidates: SearchResult[]; query: string; total: number }>> {
     const res = await fetch(`${this.baseUrl}/search?q=${encodeURIComponent(query)}`);
     return res.json();
   }
@@ -119,32 +121,17 @@ export class RecruitingAPI {
   }
 }
 
-// Helper to parse JSON fields from candidate
+// Helpers to read list fields from candidate
 export function parseExperience(candidate: Candidate): Experience[] {
-  if (!candidate.experience) return [];
-  try {
-    return JSON.parse(candidate.experience);
-  } catch {
-    return [];
-  }
+  return candidate.experience ?? [];
 }
 
 export function parseEducation(candidate: Candidate): Education[] {
-  if (!candidate.education) return [];
-  try {
-    return JSON.parse(candidate.education);
-  } catch {
-    return [];
-  }
+  return candidate.education ?? [];
 }
 
 export function parseDisplayUrls(candidate: Candidate): string[] {
-  if (!candidate.display_urls) return [];
-  try {
-    return JSON.parse(candidate.display_urls);
-  } catch {
-    return [];
-  }
+  return candidate.display_urls ?? [];
 }
 
 // Format date range like "2020-01" to "2024-01" -> "Jan 2020 - Jan 2024"
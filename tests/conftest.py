@@ -36,7 +36,7 @@ def client_fixture(engine):
     """Create a test client with overridden database session."""
 
     def get_session_override():
-        with Session(engine) as session:
+        with Session(engine, expire_on_commit=False) as session:
             yield session
 
     app.dependency_overrides[get_session] = get_session_override
@@ -54,14 +54,14 @@ def sample_candidate_fixture(session):
         title="Software Engineer at Google",
         primary_email="john@example.com",
         linkedin_url="https://linkedin.com/in/johndoe",
-        display_urls=json.dumps(["https://github.com/johndoe"]),
-        experience=json.dumps([
+        display_urls=["https://github.com/johndoe"],
+        experience=[
             {"title": "Software Engineer", "work": "Google", "time": ["2020-01", "2024-01"]},
             {"title": "Intern", "work": "Microsoft", "time": ["2019-06", "2019-09"]},
-        ]),
-        education=json.dumps([
+        ],
+        education=[
             {"degree": "PhD", "major": "Computer Science", "school": "MIT", "time": ["2015-09", "2020-05"]},
-        ]),
+        ],
         experience_text="Software Engineer Google, Intern Microsoft",
         education_text="PhD Computer Science MIT",
     )
@@ -37,6 +37,91 @@ class TestGetCandidates:
         assert "experience" not in candidate
         assert "education" not in candidate
 
+    def test_get_candidates_paginated(self, client, multiple_candidates):
+        """Should return one page of candidates with the overall total."""
+        data = client.get("/api/candidates?limit=2").json()
+        names = [c["full_name"] for c in data["data"]["candidates"]]
+        assert names == ["Alice Smith", "Bob Jones"]
+        assert data["data"]["total"] == 3
+
+        data = client.get("/api/candidates?limit=2&offset=2").json()
+        names = [c["full_name"] for c in data["data"]["candidates"]]
+        assert names == ["Carol Williams"]
+        assert data["data"]["total"] == 3
+
+    def test_get_candidates_page_not_modified(self, client, multiple_candidates):
+        """Should return 304 for an unchanged page."""
+        url = "/api/candidates?limit=2&offset=1"
+        etag = client.get(url).headers["etag"]
+
+        response = client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+
+    def test_get_candidates_pages_not_cached(self, client, multiple_candidates):
+        """Should cache only the full list, not every requested page."""
+        from backend.routes import _response_cache
+
+        client.get("/api/candidates")
+        cached_keys = set(_response_cache)
+        for offset in range(5):
+            client.get(f"/api/candidates?offset={offset}")
+            client.get(f"/api/candidates?limit=1&offset={offset}")
+        assert set(_response_cache) == cached_keys
+
+    def test_get_candidates_ndjson(self, client, multiple_candidates):
+        """Should stream one JSON summary per line when NDJSON is accepted."""
+        response = client.get(
+            "/api/candidates", headers={"Accept": "application/x-ndjson"}
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert "Accept" in response.headers["vary"]
+
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert [r["full_name"] for r in rows] == ["Alice Smith", "Bob Jones", "Carol Williams"]
+        assert "has_notes" in rows[0]
+        assert "experience" not in rows[0]
+
+    def test_get_candidates_not_modified(self, client, multiple_candidates):
+        """Should return 304 until a candidate changes."""
+        etag = client.get("/api/candidates").headers["etag"]
+
+        response = client.get("/api/candidates", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert "Accept" in response.headers["vary"]
+
+        client.patch(f"/api/candidates/{multiple_candidates[0].id}", json={"starred": True})
+        response = client.get("/api/candidates", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    def test_get_candidates_refreshed_on_insert(self, client, session, sample_candidate):
+        """Should drop the cached list when new candidates are committed."""
+        from backend.models import Candidate
+
+        etag = client.get("/api/candidates").headers["etag"]
+
+        session.add(Candidate(folder_name="Jane-Roe", full_name="Jane Roe"))
+        session.commit()
+
+        response = client.get("/api/candidates", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert len(response.json()["data"]["candidates"]) == 2
+
+    def test_get_candidates_has_notes(self, client, sample_candidate):
+        """Should flag candidates with non-empty notes."""
+        data = client.get("/api/candidates").json()
+        assert data["data"]["candidates"][0]["has_notes"] is False
+
+        client.patch(f"/api/candidates/{sample_candidate.id}", json={"notes": "Follow up"})
+        data = client.get("/api/candidates").json()
+        assert data["data"]["candidates"][0]["has_notes"] is True
+
+        client.patch(f"/api/candidates/{sample_candidate.id}", json={"notes": ""})
+        data = client.get("/api/candidates").json()
+        assert data["data"]["candidates"][0]["has_notes"] is False
+
 
 class TestGetCandidate:
     """Tests for GET /api/candidates/{id} endpoint."""
@@ -57,8 +142,10 @@ class TestGetCandidate:
         assert data["data"]["title"] == "Software Engineer at Google"
 
         # Full data should be present
-        assert "experience" in data["data"]
-        assert "education" in data["data"]
+        assert data["data"]["experience"][0]["work"] == "Google"
+        assert data["data"]["education"][0]["school"] == "MIT"
+        assert data["data"]["display_urls"] == ["https://github.com/johndoe"]
+        assert "cv_text" in data["data"]
 
     def test_get_candidate_marks_as_viewed(self, client, sample_candidate):
         """Should mark candidate as viewed when retrieved."""
@@ -72,6 +159,96 @@ class TestGetCandidate:
         assert data["data"]["viewed"] is True
         assert data["data"]["viewed_at"] is not None
 
+    def test_get_candidate_persists_viewed(self, client, session, sample_candidate):
+        """Should save the viewed state after responding."""
+        client.get(f"/api/candidates/{sample_candidate.id}")
+
+        session.refresh(sample_candidate)
+        assert sample_candidate.viewed is True
+        assert sample_candidate.viewed_at is not None
+
+    def test_get_candidate_persists_viewed_single_connection(self, tmp_path):
+        """Should release the request's connection before the background write."""
+        from fastapi.testclient import TestClient
+        from sqlalchemy.pool import QueuePool
+        from sqlmodel import Session, SQLModel, create_engine
+
+        from backend.app import app
+        from backend.database import get_session
+        from backend.models import Candidate
+
+        engine = create_engine(
+            f"sqlite:///{tmp_path / 'test.db'}",
+            connect_args={"check_same_thread": False},
+            poolclass=QueuePool,
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=1,
+        )
+        SQLModel.metadata.create_all(engine)
+        with Session(engine) as session:
+            session.add(Candidate(folder_name="Jane-Roe", full_name="Jane Roe"))
+            session.commit()
+
+        def get_session_override():
+            with Session(engine, expire_on_commit=False) as session:
+                yield session
+
+        app.dependency_overrides[get_session] = get_session_override
+        try:
+            response = TestClient(app).get("/api/candidates/1")
+        finally:
+            app.dependency_overrides.clear()
+        assert response.status_code == 200
+
+        with Session(engine) as session:
+            assert session.get(Candidate, 1).viewed is True
+
+
+class TestGetResume:
+    """Tests for GET /api/candidates/{id}/resume endpoint."""
+
+    @pytest.fixture(name="resume_candidate")
+    def resume_candidate_fixture(self, session, temp_applicants_dir, monkeypatch):
+        """Create a candidate whose folder contains a cv.pdf."""
+        from backend.models import Candidate
+
+        monkeypatch.setattr("backend.services._applicants_path", temp_applicants_dir)
+        candidate = Candidate(folder_name="Test-Candidate", full_name="Test Candidate")
+        session.add(candidate)
+        session.commit()
+        session.refresh(candidate)
+        return candidate
+
+    def test_get_resume_not_found(self, client):
+        """Should return 404 for non-existent candidate."""
+        response = client.get("/api/candidates/999/resume")
+        assert response.status_code == 404
+
+    def test_get_resume_missing_file(self, client, sample_candidate, temp_applicants_dir, monkeypatch):
+        """Should return 404 when the candidate has no cv.pdf."""
+        monkeypatch.setattr("backend.services._applicants_path", temp_applicants_dir)
+        response = client.get(f"/api/candidates/{sample_candidate.id}/resume")
+        assert response.status_code == 404
+
+    def test_get_resume_success(self, client, resume_candidate):
+        """Should serve the PDF inline with an ETag."""
+        response = client.get(f"/api/candidates/{resume_candidate.id}/resume")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/pdf"
+        assert response.headers["content-disposition"] == "inline"
+        assert response.headers["etag"].startswith('W/"')
+        assert response.content.startswith(b"%PDF")
+
+    def test_get_resume_not_modified(self, client, resume_candidate):
+        """Should return 304 when the client's ETag matches."""
+        url = f"/api/candidates/{resume_candidate.id}/resume"
+        etag = client.get(url).headers["etag"]
+
+        response = client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+
 
 class TestUpdateCandidate:
     """Tests for PATCH /api/candidates/{id} endpoint."""
@@ -117,6 +294,35 @@ class TestUpdateCandidate:
         assert data["data"]["notes"] == "Interview scheduled"
         assert data["data"]["viewed"] is True
 
+    def test_update_version_conflict(self, client, sample_candidate):
+        """Should bump the version on each update and reject stale versions."""
+        url = f"/api/candidates/{sample_candidate.id}"
+        data = client.patch(url, json={"starred": True, "version": 0}).json()
+        assert data["data"]["version"] == 1
+
+        response = client.patch(url, json={"notes": "Stale edit", "version": 0})
+        assert response.status_code == 409
+
+        data = client.get(url).json()
+        assert data["data"]["notes"] is None
+        assert data["data"]["version"] == 1
+
+    def test_update_version_not_found(self, client):
+        """Should return 404 rather than 409 for a missing candidate."""
+        response = client.patch("/api/candidates/999", json={"starred": True, "version": 0})
+        assert response.status_code == 404
+
+    def test_update_viewed_keeps_first_viewed_at(self, client, sample_candidate):
+        """Should set viewed_at on the first view only and return full data."""
+        url = f"/api/candidates/{sample_candidate.id}"
+        first = client.patch(url, json={"viewed": True}).json()["data"]
+        assert first["viewed_at"] is not None
+        assert first["experience"][0]["work"] == "Google"
+        assert "cv_text" in first
+
+        second = client.patch(url, json={"viewed": True}).json()["data"]
+        assert second["viewed_at"] == first["viewed_at"]
+
 
 class TestSearch:
     """Tests for GET /api/search endpoint."""
@@ -136,6 +342,16 @@ class TestSearch:
         assert len(data["data"]["candidates"]) == 1
         assert data["data"]["candidates"][0]["full_name"] == "Alice Smith"
 
+    def test_search_paginated(self, client, multiple_candidates):
+        """Should return one page of results with the total match count."""
+        data = client.get("/api/search?q=PhD&limit=1").json()
+        assert len(data["data"]["candidates"]) == 1
+        assert data["data"]["total"] == 2
+
+        data = client.get("/api/search?q=PhD&limit=1&offset=1").json()
+        assert len(data["data"]["candidates"]) == 1
+        assert data["data"]["total"] == 2
+
     def test_search_by_company(self, client, multiple_candidates):
         """Should find candidates by company in experience."""
         response = client.get("/api/search?q=DeepMind")
@@ -163,6 +379,26 @@ class TestSearch:
         assert len(data["data"]["candidates"]) == 1
         assert data["data"]["candidates"][0]["full_name"] == "Bob Jones"
 
+    def test_search_whole_word(self, client, multiple_candidates):
+        """Should not match partial words."""
+        response = client.get("/api/search?q=Deep")
+        assert response.status_code == 200
+
+        data = response.json()
+        assert len(data["data"]["candidates"]) == 0
+
+    def test_search_after_update(self, client, session, multiple_candidates):
+        """Should reflect edits to searchable fields."""
+        alice = multiple_candidates[0]
+        alice.title = "Research Engineer at Cohere"
+        session.add(alice)
+        session.commit()
+
+        response = client.get("/api/search?q=Cohere")
+        data = response.json()
+        assert len(data["data"]["candidates"]) == 1
+        assert data["data"]["candidates"][0]["full_name"] == "Alice Smith"
+
     def test_search_no_results(self, client, multiple_candidates):
         """Should return empty list for no matches."""
         response = client.get("/api/search?q=nonexistent")
@@ -176,6 +412,21 @@ class TestSearch:
 class TestStats:
     """Tests for GET /api/stats endpoint."""
 
+    def test_stats_query_uses_partial_indexes(self, engine):
+        """Should count each flag from its partial index, not a full scan."""
+        from backend.routes import STATS_QUERY
+
+        with engine.connect() as connection:
+            plan = connection.exec_driver_sql(
+                f"EXPLAIN QUERY PLAN {STATS_QUERY.compile(engine)}"
+            ).all()
+        details = " | ".join(row[3] for row in plan)
+
+        assert "USING INDEX ix_candidate_viewed_true" in details
+        assert "USING INDEX ix_candidate_starred_true" in details
+        assert "USING INDEX ix_candidate_has_notes" in details
+        assert "ix_candidate_list_cover" not in details
+
     def test_stats_empty(self, client):
         """Should return zero counts when no candidates."""
         response = client.get("/api/stats")
@@ -198,6 +449,19 @@ class TestStats:
         assert data["data"]["unviewed"] == 2
         assert data["data"]["starred"] == 1  # Carol is pre-starred
 
+    def test_stats_after_update(self, client, multiple_candidates):
+        """Should reflect writes made after stats were last fetched."""
+        assert client.get("/api/stats").json()["data"]["starred"] == 1
+
+        client.patch(
+            f"/api/candidates/{multiple_candidates[0].id}",
+            json={"starred": True, "notes": "Strong publication record"},
+        )
+
+        data = client.get("/api/stats").json()
+        assert data["data"]["starred"] == 2
+        assert data["data"]["with_notes"] == 1
+
 
 class TestDataLoader:
     """Tests for the data loading service."""
@@ -245,6 +509,26 @@ class TestDataLoader:
         assert "PhD CS MIT" in text
         assert "BS Math Stanford" in text
 
+    def test_extract_pdf_text(self, tmp_path):
+        """Should extract text from every page without blank lines."""
+        fitz = pytest.importorskip("fitz")
+        from backend.services import extract_pdf_text
+
+        pdf_path = tmp_path / "cv.pdf"
+        doc = fitz.open()
+        doc.new_page().insert_text((72, 72), "Jane Roe\n\n   Research Engineer   ")
+        doc.new_page().insert_text((72, 72), "PhD Stanford")
+        doc.save(str(pdf_path))
+        doc.close()
+
+        assert extract_pdf_text(pdf_path) == "Jane Roe\nResearch Engineer\nPhD Stanford"
+
+    def test_extract_pdf_text_invalid(self, temp_applicants_dir):
+        """Should return None for an unreadable PDF."""
+        from backend.services import extract_pdf_text
+
+        assert extract_pdf_text(temp_applicants_dir / "Test-Candidate" / "cv.pdf") is None
+
     def test_load_candidate_from_folder(self, temp_applicants_dir):
         """Should load candidate data from folder."""
         from backend.services import load_candidate_from_folder
@@ -259,7 +543,100 @@ class TestDataLoader:
         assert candidate.primary_email == "test@example.com"
 
         # Check URLs were filtered (arxiv removed)
-        urls = json.loads(candidate.display_urls)
+        urls = candidate.display_urls
         assert len(urls) == 1
         assert "github.com" in urls[0]
         assert not any("arxiv" in u for u in urls)
+
+    @pytest.mark.parametrize("use_threads", [True, False])
+    def test_load_candidates_from_disk(self, session, temp_applicants_dir, use_threads):
+        """Should load new folders in parallel and skip already loaded ones."""
+        import shutil
+
+        from sqlmodel import select
+
+        from backend.models import Candidate
+        from backend.services import load_candidates_from_disk
+
+        shutil.copytree(
+            temp_applicants_dir / "Test-Candidate",
+            temp_applicants_dir / "Other-Candidate",
+        )
+
+        load_candidates_from_disk(
+            session, temp_applicants_dir, reader_workers=2, use_threads=use_threads
+        )
+        names = session.exec(select(Candidate.folder_name).order_by(Candidate.folder_name)).all()
+        assert names == ["Other-Candidate", "Test-Candidate"]
+
+        # Bulk-loaded rows should be in the search index
+        matches = session.connection().exec_driver_sql(
+            "SELECT rowid FROM candidate_fts WHERE candidate_fts MATCH 'TestCorp'"
+        ).all()
+        assert len(matches) == 2
+
+        # Column defaults fill in fields the folder reader leaves out
+        candidates = session.exec(select(Candidate)).all()
+        assert all(c.starred is False and c.viewed is False for c in candidates)
+        assert all(c.created_at is not None for c in candidates)
+
+        # Second load should skip existing folders
+        load_candidates_from_disk(session, temp_applicants_dir, use_threads=use_threads)
+        assert len(session.exec(select(Candidate)).all()) == 2
+
+
+class TestStaticFiles:
+    """Tests for the in-memory frontend static file cache."""
+
+    @pytest.fixture(name="static_client")
+    def static_client_fixture(self, tmp_path):
+        """Create a test client serving a fake frontend build."""
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        from backend.static import CachedStaticFiles
+
+        (tmp_path / "index.html").write_text("<html>v1</html>")
+        (tmp_path / "assets").mkdir()
+        (tmp_path / "assets" / "index-abc123.js").write_text("console.log(1)")
+
+        static_app = FastAPI()
+        static_app.mount("/", CachedStaticFiles(directory=str(tmp_path), html=True))
+        return TestClient(static_app), tmp_path
+
+    def test_serves_index(self, static_client):
+        """Should serve index.html with a revalidation policy."""
+        client, _ = static_client
+        response = client.get("/")
+        assert response.status_code == 200
+        assert response.text == "<html>v1</html>"
+        assert response.headers["content-type"].startswith("text/html")
+        assert response.headers["cache-control"] == "no-cache"
+
+    def test_hashed_assets_immutable(self, static_client):
+        """Should mark hashed bundles as immutable."""
+        client, _ = static_client
+        response = client.get("/assets/index-abc123.js")
+        assert response.status_code == 200
+        assert "immutable" in response.headers["cache-control"]
+
+    def test_not_modified(self, static_client):
+        """Should return 304 when the ETag matches."""
+        client, _ = static_client
+        etag = client.get("/").headers["etag"]
+        response = client.get("/", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+    def test_reloads_on_change(self, static_client):
+        """Should re-read a file after it changes on disk."""
+        import os
+
+        client, root = static_client
+        assert client.get("/").text == "<html>v1</html>"
+
+        index = root / "index.html"
+        index.write_text("<html>v2!</html>")
+        st = index.stat()
+        os.utime(index, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        assert client.get("/").text == "<html>v2!</html>"